@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models.functions import Substr
 from .models import BlogPost, Comment
 
 
@@ -7,7 +8,7 @@ class BlogPostAdmin(admin.ModelAdmin):
     list_display = ['title', 'comment_count', 'created_at', 'updated_at']
     list_filter = ['created_at', 'updated_at']
     search_fields = ['title', 'content']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['comment_count', 'created_at', 'updated_at']
     ordering = ['-created_at']
     
     fieldsets = (
@@ -15,7 +16,7 @@ class BlogPostAdmin(admin.ModelAdmin):
             'fields': ('title', 'content')
         }),
         ('Metadata', {
-            'fields': ('created_at', 'updated_at'),
+            'fields': ('comment_count', 'created_at', 'updated_at'),
             'classes': ('collapse',)
         }),
     )
@@ -28,8 +29,17 @@ class CommentAdmin(admin.ModelAdmin):
     search_fields = ['author_name', 'content', 'blog_post__title']
     readonly_fields = ['created_at']
     ordering = ['-created_at']
+    list_select_related = ['blog_post']
+    
+    def get_queryset(self, request):
+        # The preview only needs the first 50 characters (plus one to know
+        # whether it was truncated), so leave the full texts in the database
+        return super().get_queryset(request).annotate(
+            _content_preview=Substr('content', 1, 51)
+        ).defer('content', 'blog_post__content')
     
     def content_preview(self, obj):
-        return obj.content[:50] + '...' if len(obj.content) > 50 else obj.content
+        preview = obj._content_preview
+        return preview[:50] + '...' if len(preview) > 50 else preview
     
     content_preview.short_description = 'Content Preview' 
\ No newline at end of file
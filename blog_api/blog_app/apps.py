@@ -4,4 +4,7 @@ from django.apps import AppConfig
 class BlogAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'blog_app'
-    verbose_name = 'Blog Application' 
\ No newline at end of file
+    verbose_name = 'Blog Application'
+    
+    def ready(self):
+        from . import signals  # noqa: F401
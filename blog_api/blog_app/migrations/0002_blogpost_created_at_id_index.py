@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-15 07:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='blogpost',
+            name='blog_app_bl_created_aa9ade_idx',
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['-created_at', 'id'], name='blog_app_bl_created_268081_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-15 07:43
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_app', '0002_blogpost_created_at_id_index'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='blogpost',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='comment',
+            options={},
+        ),
+    ]
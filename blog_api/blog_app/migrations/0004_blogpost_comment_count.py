@@ -0,0 +1,36 @@
+# Generated by Django 4.2.7 on 2026-10-15 07:44
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def populate_comment_count(apps, schema_editor):
+    BlogPost = apps.get_model('blog_app', 'BlogPost')
+    Comment = apps.get_model('blog_app', 'Comment')
+    comment_counts = (
+        Comment.objects
+        .filter(blog_post=models.OuterRef('pk'))
+        .order_by()
+        .values('blog_post')
+        .annotate(count=models.Count('*'))
+        .values('count')
+    )
+    BlogPost.objects.update(
+        comment_count=Coalesce(models.Subquery(comment_counts), 0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_app', '0003_remove_default_ordering'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of comments on the blog post'),
+        ),
+        migrations.RunPython(populate_comment_count, migrations.RunPython.noop),
+    ]
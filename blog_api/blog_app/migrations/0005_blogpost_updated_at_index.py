@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-15 07:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_app', '0004_blogpost_comment_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['updated_at'], name='blog_app_bl_updated_00be2b_idx'),
+        ),
+    ]
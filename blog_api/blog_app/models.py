@@ -1,6 +1,5 @@
 from django.db import models
 from django.core.validators import MinLengthValidator
-from django.utils import timezone
 
 
 class BlogPost(models.Model):
@@ -8,6 +7,8 @@ class BlogPost(models.Model):
     Model representing a blog post.
     
     A blog post has a title and content, and can have multiple comments.
+    The number of comments is stored on the post and kept current by the
+    Comment signal handlers in signals.py.
     """
     title = models.CharField(
         max_length=200, 
@@ -18,21 +19,37 @@ class BlogPost(models.Model):
         validators=[MinLengthValidator(10)],
         help_text="Content of the blog post (minimum 10 characters)"
     )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of comments on the blog post"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
-        ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['-created_at']),
+            models.Index(fields=['-created_at', 'id']),
+            models.Index(fields=['updated_at']),
         ]
     
+    def save(self, *args, **kwargs):
+        # comment_count is only changed by the Comment signals' F() updates;
+        # updating a post must never write back a possibly stale value
+        if not self._state.adding and not kwargs.get('force_insert'):
+            update_fields = kwargs.get('update_fields')
+            if update_fields is None:
+                update_fields = [
+                    field.name for field in self._meta.concrete_fields
+                    if not field.primary_key
+                ]
+            kwargs['update_fields'] = [
+                name for name in update_fields if name != 'comment_count'
+            ]
+        super().save(*args, **kwargs)
+    
     def __str__(self):
         return self.title
-    
-    @property
-    def comment_count(self):
-        return self.comments.count()
 
 
 class Comment(models.Model):
@@ -59,10 +76,10 @@ class Comment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
-        ordering = ['-created_at']
         indexes = [
             models.Index(fields=['blog_post', '-created_at']),
         ]
     
     def __str__(self):
-        return f"Comment by {self.author_name} on {self.blog_post.title}" 
\ No newline at end of file
+        # Uses the foreign key value so stringifying never queries BlogPost
+        return f"Comment by {self.author_name} (post #{self.blog_post_id})" 
\ No newline at end of file
@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+
+class BlogPostCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the blog post list.
+    
+    Pages are fetched by seeking on the (-created_at, id) index instead of
+    using OFFSET, so deep pages cost the same as the first one and no
+    COUNT(*) query is needed.
+    """
+    ordering = ('-created_at', 'id')
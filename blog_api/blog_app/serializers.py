@@ -8,16 +8,6 @@ class CommentSerializer(serializers.ModelSerializer):
     class Meta:
         model = Comment
         fields = ['id', 'author_name', 'content', 'created_at']
-        
-    def validate_author_name(self, value):
-        if not value.strip():
-            raise serializers.ValidationError("Author name cannot be empty.")
-        return value.strip()
-    
-    def validate_content(self, value):
-        if not value.strip():
-            raise serializers.ValidationError("Comment content cannot be empty.")
-        return value.strip()
 
 
 class BlogPostListSerializer(serializers.ModelSerializer):
@@ -31,7 +21,7 @@ class BlogPostListSerializer(serializers.ModelSerializer):
 
 
 class BlogPostDetailSerializer(serializers.ModelSerializer):
-    comments = CommentSerializer(many=True, read_only=True)
+    comments = CommentSerializer(source='recent_comments', many=True, read_only=True)
     comment_count = serializers.IntegerField(read_only=True)
     created_at = serializers.DateTimeField(read_only=True)
     updated_at = serializers.DateTimeField(read_only=True)
@@ -45,14 +35,4 @@ class BlogPostDetailSerializer(serializers.ModelSerializer):
 class BlogPostCreateUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = BlogPost
-        fields = ['title', 'content']
-        
-    def validate_title(self, value):
-        if not value.strip():
-            raise serializers.ValidationError("Title cannot be empty.")
-        return value.strip()
-    
-    def validate_content(self, value):
-        if not value.strip():
-            raise serializers.ValidationError("Content cannot be empty.")
-        return value.strip() 
\ No newline at end of file
+        fields = ['title', 'content'] 
\ No newline at end of file
@@ -0,0 +1,59 @@
+from django.db.models import F, QuerySet
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import BlogPost, Comment
+
+
+def _update_blog_post(blog_post_id, comment_delta=0):
+    # Comment changes alter the post's representation, so also bump its
+    # updated_at to keep it usable as a cache validator
+    changes = {'updated_at': timezone.now()}
+    if comment_delta:
+        changes['comment_count'] = F('comment_count') + comment_delta
+    BlogPost.objects.filter(pk=blog_post_id).update(**changes)
+
+
+@receiver(pre_save, sender=Comment)
+def remember_previous_blog_post(sender, instance, **kwargs):
+    """
+    Record which post an existing comment belonged to, in case it is moved.
+    """
+    # Fixture loading saves the stored comment_count along with the posts
+    if kwargs.get('raw'):
+        return
+    if not instance._state.adding:
+        instance._previous_blog_post_id = (
+            Comment.objects
+            .filter(pk=instance.pk)
+            .values_list('blog_post_id', flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Comment)
+def update_blog_post_on_comment_save(sender, instance, created, **kwargs):
+    if kwargs.get('raw'):
+        return
+    
+    previous_blog_post_id = getattr(instance, '_previous_blog_post_id', None)
+    
+    if created:
+        _update_blog_post(instance.blog_post_id, comment_delta=1)
+    elif previous_blog_post_id not in (None, instance.blog_post_id):
+        _update_blog_post(previous_blog_post_id, comment_delta=-1)
+        _update_blog_post(instance.blog_post_id, comment_delta=1)
+    else:
+        _update_blog_post(instance.blog_post_id)
+
+
+@receiver(post_delete, sender=Comment)
+def update_blog_post_on_comment_delete(sender, instance, origin=None, **kwargs):
+    # Comments deleted in cascade from their blog post need no bookkeeping
+    if isinstance(origin, BlogPost) or (
+        isinstance(origin, QuerySet) and origin.model is BlogPost
+    ):
+        return
+    
+    _update_blog_post(instance.blog_post_id, comment_delta=-1)
@@ -1,10 +1,25 @@
+import importlib.util
+import os
+import tempfile
+from decimal import Decimal
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
 from django.test import TestCase
 from django.urls import reverse
-from rest_framework.test import APITestCase
+from django.utils import timezone
+from django.utils.http import http_date
+from drf_spectacular.generators import SchemaGenerator
+from rest_framework.test import APITestCase, APITransactionTestCase
 from rest_framework import status
 import json
 
 from .models import BlogPost, Comment
+from .pagination import BlogPostCursorPagination
+from .renderers import ORJSONRenderer
+from .serializers import BlogPostCreateUpdateSerializer
 
 
 class BlogPostModelTest(TestCase):    
@@ -25,19 +40,122 @@ class BlogPostModelTest(TestCase):
         """Test string representation of blog post."""
         self.assertEqual(str(self.blog_post), "Test Blog Post")
     
-    def test_comment_count_property(self):
-        """Test comment count property."""
+    def test_comment_count(self):
+        """Test comment count follows comments being added and removed."""
         self.assertEqual(self.blog_post.comment_count, 0)
         
         # Add a comment
-        Comment.objects.create(
+        comment = Comment.objects.create(
             blog_post=self.blog_post,
             author_name="Test Author",
             content="Test comment content"
         )
         
+        self.blog_post.refresh_from_db()
+        self.assertEqual(self.blog_post.comment_count, 1)
+
+        # Delete it again, through a queryset as the admin does
+        Comment.objects.filter(pk=comment.pk).delete()
+
+        self.blog_post.refresh_from_db()
+        self.assertEqual(self.blog_post.comment_count, 0)
+
+    def test_comment_count_survives_stale_save(self):
+        """Test saving a post loaded before a new comment keeps the count."""
+        stale_post = BlogPost.objects.get(pk=self.blog_post.pk)
+        Comment.objects.create(
+            blog_post=self.blog_post,
+            author_name="Test Author",
+            content="Test comment content"
+        )
+
+        stale_post.title = "Edited Blog Post"
+        stale_post.save()
+
+        self.blog_post.refresh_from_db()
+        self.assertEqual(self.blog_post.title, "Edited Blog Post")
+        self.assertEqual(self.blog_post.comment_count, 1)
+
+        # Updates through the write serializer behave the same way
+        serializer = BlogPostCreateUpdateSerializer(
+            stale_post,
+            data={'title': 'Serializer Edit', 'content': 'Edited blog post content.'}
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.blog_post.refresh_from_db()
+        self.assertEqual(self.blog_post.title, "Serializer Edit")
         self.assertEqual(self.blog_post.comment_count, 1)
 
+    def test_comment_count_when_comment_moves(self):
+        """Test comment counts follow a comment moved to another post."""
+        comment = Comment.objects.create(
+            blog_post=self.blog_post,
+            author_name="Test Author",
+            content="Test comment content"
+        )
+        other_post = BlogPost.objects.create(
+            title="Other Blog Post",
+            content="This is other test content."
+        )
+
+        comment.blog_post = other_post
+        comment.save()
+
+        self.blog_post.refresh_from_db()
+        other_post.refresh_from_db()
+        self.assertEqual(self.blog_post.comment_count, 0)
+        self.assertEqual(other_post.comment_count, 1)
+
+    def test_delete_blog_post_with_comments(self):
+        """Test deleting a post does not update it once per comment."""
+        for i in range(20):
+            Comment.objects.create(
+                blog_post=self.blog_post,
+                author_name="Test Author",
+                content="Test comment content"
+            )
+
+        # Comment lookup, then the comment and post deletes
+        with self.assertNumQueries(3):
+            self.blog_post.delete()
+
+        self.assertFalse(Comment.objects.exists())
+
+    def test_delete_blog_posts_queryset_with_comments(self):
+        """Test deleting posts in bulk does not update them per comment."""
+        for i in range(20):
+            Comment.objects.create(
+                blog_post=self.blog_post,
+                author_name="Test Author",
+                content="Test comment content"
+            )
+
+        # Post and comment lookups, then the comment and post deletes
+        with self.assertNumQueries(4):
+            BlogPost.objects.all().delete()
+
+        self.assertFalse(Comment.objects.exists())
+
+    def test_comment_count_fixture_round_trip(self):
+        """Test loading a fixture does not count its comments twice."""
+        for i in range(2):
+            Comment.objects.create(
+                blog_post=self.blog_post,
+                author_name="Test Author",
+                content="Test comment content"
+            )
+
+        with tempfile.NamedTemporaryFile(mode='w+', suffix='.json') as fixture:
+            call_command('dumpdata', 'blog_app', stdout=fixture)
+            fixture.flush()
+            BlogPost.objects.all().delete()
+            call_command('loaddata', fixture.name, verbosity=0)
+
+        self.blog_post.refresh_from_db()
+        self.assertEqual(self.blog_post.comment_count, 2)
+
 
 class CommentModelTest(TestCase):
     """Test Comment model functionality."""
@@ -59,11 +177,23 @@ class CommentModelTest(TestCase):
         self.assertEqual(self.comment.content, "This is a test comment.")
         self.assertEqual(self.comment.blog_post, self.blog_post)
         self.assertTrue(self.comment.created_at)
+
+    def test_comment_changes_touch_blog_post(self):
+        """Test saving or deleting a comment bumps the post's updated_at."""
+        updated_at = BlogPost.objects.get(pk=self.blog_post.pk).updated_at
+        self.assertGreaterEqual(updated_at, self.comment.created_at)
+
+        self.comment.delete()
+        self.assertGreater(
+            BlogPost.objects.get(pk=self.blog_post.pk).updated_at, updated_at
+        )
     
     def test_comment_str_representation(self):
         """Test string representation of comment."""
-        expected = f"Comment by Test Author on {self.blog_post.title}"
-        self.assertEqual(str(self.comment), expected)
+        expected = f"Comment by Test Author (post #{self.blog_post.id})"
+        comment = Comment.objects.get(pk=self.comment.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(str(comment), expected)
 
 
 class BlogPostListCreateAPITest(APITestCase):
@@ -94,7 +224,92 @@ class BlogPostListCreateAPITest(APITestCase):
         self.assertEqual(post_data['comment_count'], 1)
         self.assertIn('id', post_data)
         self.assertIn('created_at', post_data)
-    
+
+    def test_get_blog_posts_list_query_count(self):
+        """Test comment counts do not issue a query per post."""
+        for i in range(5):
+            post = BlogPost.objects.create(
+                title=f"Another Post {i}",
+                content="Another post content"
+            )
+            Comment.objects.create(
+                blog_post=post,
+                author_name="Commenter",
+                content="Another comment"
+            )
+
+        # One query for the ETag and one for the page
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 6)
+        for post_data in response.data['results']:
+            self.assertEqual(post_data['comment_count'], 1)
+            self.assertNotIn('content', post_data)
+
+    def test_get_blog_posts_list_pagination(self):
+        """Test paginating the list with cursors, newest posts first."""
+        for i in range(2):
+            BlogPost.objects.create(
+                title=f"Another Post {i}",
+                content="Another post content"
+            )
+
+        with mock.patch.object(BlogPostCursorPagination, 'page_size', 2):
+            first_page = self.client.get(self.url)
+            second_page = self.client.get(first_page.data['next'])
+
+        self.assertNotIn('count', first_page.data)
+        self.assertEqual(
+            [post['title'] for post in first_page.data['results']],
+            ["Another Post 1", "Another Post 0"]
+        )
+        self.assertEqual(
+            [post['title'] for post in second_page.data['results']],
+            ["Existing Post"]
+        )
+        self.assertIsNone(second_page.data['next'])
+
+    def test_get_blog_posts_list_not_modified(self):
+        """Test revalidating the list with a current ETag returns 304."""
+        response = self.client.get(self.url)
+        etag = response['ETag']
+        self.assertNotIn('Last-Modified', response)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # A new comment changes the comment count, so the ETag must change
+        Comment.objects.create(
+            blog_post=self.blog_post,
+            author_name="Commenter",
+            content="Another comment"
+        )
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_get_blog_posts_list_after_newest_post_deleted(self):
+        """Test If-Modified-Since alone never hides a deleted post."""
+        newest_post = BlogPost.objects.create(
+            title="Newest Post",
+            content="Newest post content"
+        )
+        if_modified_since = http_date(newest_post.updated_at.timestamp())
+
+        newest_post.delete()
+
+        response = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=if_modified_since
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [post['title'] for post in response.data['results']],
+            ["Existing Post"]
+        )
+
     def test_create_blog_post_valid_data(self):
         """Test creating a blog post with valid data."""
         data = {
@@ -112,6 +327,22 @@ class BlogPostListCreateAPITest(APITestCase):
         self.assertEqual(response.data['content'], 'This is new blog post content.')
         self.assertEqual(response.data['comment_count'], 0)
         self.assertIn('id', response.data)
+
+    def test_create_blog_post_query_count(self):
+        """Test creating a blog post only runs the INSERT."""
+        data = {
+            'title': 'New Blog Post',
+            'content': 'This is new blog post content.'
+        }
+        
+        # The INSERT, inside the view's transaction (a savepoint here, as
+        # the test itself runs in a transaction)
+        with self.assertNumQueries(3):
+            response = self.client.post(self.url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['comments'], [])
+        self.assertEqual(response.data['comment_count'], 0)
     
     def test_create_blog_post_invalid_data(self):
         """Test creating blog post with invalid data."""
@@ -130,11 +361,30 @@ class BlogPostListCreateAPITest(APITestCase):
         response = self.client.post(self.url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_create_blog_post_trims_whitespace(self):
+        """Test surrounding whitespace is stripped before validation."""
+        # Test whitespace-only title
+        data = {'title': '   ', 'content': 'Valid content'}
+        response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+        # Test title too short once trimmed
+        data = {'title': '  Tiny  ', 'content': 'Valid content'}
+        response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+        data = {'title': '  Padded Title  ', 'content': '  Padded content  '}
+        response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['title'], 'Padded Title')
+        self.assertEqual(response.data['content'], 'Padded content')
+
 
 class BlogPostDetailAPITest(APITestCase):
     """Test GET /api/posts/{id}/ endpoint."""
     
     def setUp(self):
+        cache.clear()
         self.blog_post = BlogPost.objects.create(
             title="Detail Test Post",
             content="Content for detail testing"
@@ -162,7 +412,71 @@ class BlogPostDetailAPITest(APITestCase):
         comment_data = response.data['comments'][0]
         self.assertEqual(comment_data['author_name'], "Comment Author")
         self.assertEqual(comment_data['content'], "Comment for detail testing")
-    
+
+    def test_get_blog_post_detail_query_count(self):
+        """Test detail loads the post and its comments without a COUNT query."""
+        # One query for the post version, then the post and its comments
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['comment_count'], 1)
+
+    def test_get_blog_post_detail_cached(self):
+        """Test repeated detail requests are served from the cache."""
+        first_response = self.client.get(self.url)
+
+        # Only the post version is queried on a cache hit
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data, first_response.data)
+
+        # A new comment changes the post version and invalidates the entry
+        Comment.objects.create(
+            blog_post=self.blog_post,
+            author_name="Another Author",
+            content="Another comment for detail testing"
+        )
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['comment_count'], 2)
+        self.assertEqual(len(response.data['comments']), 2)
+
+    def test_get_blog_post_detail_not_modified(self):
+        """Test revalidating the detail with a current ETag returns 304."""
+        response = self.client.get(self.url)
+        etag = response['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Comment.objects.create(
+            blog_post=self.blog_post,
+            author_name="Another Author",
+            content="Another comment for detail testing"
+        )
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['comment_count'], 2)
+
+    def test_get_blog_post_detail_limits_comments(self):
+        """Test only the most recent comments are embedded in the detail."""
+        for i in range(3):
+            Comment.objects.create(
+                blog_post=self.blog_post,
+                author_name=f"Author {i}",
+                content="Another comment for detail testing"
+            )
+
+        with mock.patch('blog_app.views.COMMENTS_PREVIEW_LIMIT', 2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['comment_count'], 4)
+        self.assertEqual(
+            [comment['author_name'] for comment in response.data['comments']],
+            ["Author 2", "Author 1"]
+        )
+
     def test_get_nonexistent_blog_post(self):
         """Test retrieving non-existent blog post."""
         url = reverse('blog-post-detail', kwargs={'id': 99999})
@@ -171,15 +485,21 @@ class BlogPostDetailAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
 
-class CommentCreateAPITest(APITestCase):
-    """Test POST /api/posts/{id}/comments/ endpoint."""
+class CommentCreateAPITest(APITransactionTestCase):
+    """
+    Test POST /api/posts/{id}/comments/ endpoint.
+    
+    The blog post's existence is enforced by the foreign key constraint
+    when the comment is committed, so these tests run outside a wrapping
+    transaction.
+    """
     
     def setUp(self):
         self.blog_post = BlogPost.objects.create(
             title="Post for Comments",
             content="Content for comment testing"
         )
-        self.url = reverse('comment-create', kwargs={'post_id': self.blog_post.id})
+        self.url = reverse('comment-list-create', kwargs={'post_id': self.blog_post.id})
     
     def test_create_comment_valid_data(self):
         """Test creating comment with valid data."""
@@ -216,7 +536,7 @@ class CommentCreateAPITest(APITestCase):
     
     def test_create_comment_nonexistent_post(self):
         """Test creating comment for non-existent blog post."""
-        url = reverse('comment-create', kwargs={'post_id': 99999})
+        url = reverse('comment-list-create', kwargs={'post_id': 99999})
         data = {
             'author_name': 'Test Commenter',
             'content': 'This comment should fail.'
@@ -224,6 +544,124 @@ class CommentCreateAPITest(APITestCase):
         
         response = self.client.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(Comment.objects.count(), 0)
+
+    def test_create_comment_malformed_json(self):
+        """Test creating comment with a malformed JSON body."""
+        response = self.client.post(
+            self.url, '{"author_name": "Test',
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('JSON parse error', response.json()['detail'])
+
+
+class CommentListAPITest(APITestCase):
+    """Test GET /api/posts/{id}/comments/ endpoint."""
+
+    def setUp(self):
+        self.blog_post = BlogPost.objects.create(
+            title="Post for Comments",
+            content="Content for comment testing"
+        )
+        for i in range(3):
+            Comment.objects.create(
+                blog_post=self.blog_post,
+                author_name=f"Author {i}",
+                content="Comment for list testing"
+            )
+        self.url = reverse('comment-list-create', kwargs={'post_id': self.blog_post.id})
+
+    def test_get_comments_list(self):
+        """Test listing all comments of a blog post, newest first."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(
+            [comment['author_name'] for comment in response.data['results']],
+            ["Author 2", "Author 1", "Author 0"]
+        )
+
+    def test_get_comments_list_same_timestamp(self):
+        """Test comments with the same timestamp keep a stable order."""
+        Comment.objects.update(created_at=timezone.now())
+
+        with mock.patch('rest_framework.pagination.PageNumberPagination.page_size', 2):
+            first_page = self.client.get(self.url)
+            second_page = self.client.get(first_page.data['next'])
+
+        self.assertEqual(
+            [comment['author_name'] for comment in first_page.data['results']]
+            + [comment['author_name'] for comment in second_page.data['results']],
+            ["Author 2", "Author 1", "Author 0"]
+        )
+
+    def test_comments_schema_responses(self):
+        """Test each comment endpoint method documents only its own responses."""
+        schema = SchemaGenerator().get_schema(request=None, public=True)
+        operations = schema['paths']['/api/posts/{post_id}/comments/']
+
+        self.assertEqual(set(operations['get']['responses']), {'200', '404'})
+        self.assertEqual(set(operations['post']['responses']), {'201', '404'})
+
+    def test_get_comments_nonexistent_post(self):
+        """Test listing comments of a non-existent blog post."""
+        url = reverse('comment-list-create', kwargs={'post_id': 99999})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ORJSONRendererTest(TestCase):
+    """Test the orjson-backed JSON renderer."""
+
+    def test_render(self):
+        """Test rendering native and fallback types."""
+        data = {'id': 1, 'title': 'Post', 'ratio': Decimal('1.5')}
+        self.assertEqual(
+            ORJSONRenderer().render(data),
+            b'{"id":1,"title":"Post","ratio":1.5}'
+        )
+
+    def test_render_none(self):
+        """Test rendering an empty body."""
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+
+class DatabaseSettingsTest(TestCase):
+    """Test the database configuration built from DATABASE_URL."""
+
+    def load_settings(self, **environ):
+        """Execute a fresh copy of the settings module with the given environment."""
+        path = os.path.join(settings.BASE_DIR, 'blog_project', 'settings.py')
+        spec = importlib.util.spec_from_file_location('settings_under_test', path)
+        module = importlib.util.module_from_spec(spec)
+        with mock.patch.dict(os.environ, environ):
+            spec.loader.exec_module(module)
+        return module
+
+    def test_postgres_options_from_url_are_kept(self):
+        """Test the statement timeout is merged with the URL's options."""
+        module = self.load_settings(
+            DATABASE_URL='postgresql://u:p@h:5432/db?sslmode=require',
+            DB_STATEMENT_TIMEOUT='3000'
+        )
+        self.assertEqual(
+            module.DATABASES['default']['OPTIONS'],
+            {'sslmode': 'require', 'options': '-c statement_timeout=3000'}
+        )
+
+    def test_postgres_options_parameter_is_extended(self):
+        """Test an options parameter in the URL is extended, not replaced."""
+        module = self.load_settings(
+            DATABASE_URL='postgresql://u:p@h:5432/db?options=-c%20search_path%3Dblog',
+            DB_STATEMENT_TIMEOUT='3000'
+        )
+        self.assertEqual(
+            module.DATABASES['default']['OPTIONS']['options'],
+            '-c search_path=blog -c statement_timeout=3000'
+        )
 
 
 class APIIntegrationTest(APITestCase):
@@ -259,7 +697,7 @@ class APIIntegrationTest(APITestCase):
         }
         
         comment_response = self.client.post(
-            reverse('comment-create', kwargs={'post_id': post_id}),
+            reverse('comment-list-create', kwargs={'post_id': post_id}),
             comment_data,
             format='json'
         )
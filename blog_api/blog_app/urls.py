@@ -2,7 +2,7 @@ from django.urls import path
 from .views import (
     BlogPostListCreateView,
     BlogPostDetailView,
-    CommentCreateView,
+    CommentListCreateView,
 )
 
 urlpatterns = [
@@ -11,5 +11,5 @@ urlpatterns = [
     path('posts/<int:id>/', BlogPostDetailView.as_view(), name='blog-post-detail'),
     
     # Comment endpoints
-    path('posts/<int:post_id>/comments/', CommentCreateView.as_view(), name='comment-create'),
+    path('posts/<int:post_id>/comments/', CommentListCreateView.as_view(), name='comment-list-create'),
 ] 
\ No newline at end of file
@@ -1,9 +1,15 @@
 from rest_framework import generics, status
 from rest_framework.response import Response
-from django.shortcuts import get_object_or_404
-from drf_spectacular.utils import extend_schema, OpenApiResponse
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max, Prefetch
+from django.http import Http404
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiResponse
 
 from .models import BlogPost, Comment
+from .pagination import BlogPostCursorPagination
 from .serializers import (
     BlogPostListSerializer, 
     BlogPostDetailSerializer, 
@@ -11,6 +17,37 @@ from .serializers import (
     CommentSerializer
 )
 
+# Number of most recent comments embedded in the blog post detail response
+COMMENTS_PREVIEW_LIMIT = 50
+
+# Seconds a rendered blog post detail stays cached. Cache keys include the
+# post's version, so entries never go stale and only need to expire
+POST_DETAIL_CACHE_TIMEOUT = 300
+
+
+def _make_etag(last_modified, count):
+    timestamp = last_modified.timestamp() if last_modified else 0
+    return f'W/"{timestamp}-{count}"'
+
+
+def _not_modified_response(request, etag, last_modified):
+    """
+    Return a 304 response if the client's cached copy is still current,
+    otherwise None.
+    """
+    return get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+
+
+def _set_validators(response, etag, last_modified):
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
+
 
 @extend_schema(
     tags=['Blog Posts'],
@@ -25,15 +62,39 @@ class BlogPostListCreateView(generics.ListCreateAPIView):
     GET /api/posts: List all blog posts with comment counts.
     POST /api/posts: Create a new blog post.
     """
+    pagination_class = BlogPostCursorPagination
     
     def get_queryset(self):
-        return BlogPost.objects.prefetch_related('comments')
+        # Only the columns rendered by BlogPostListSerializer are fetched
+        return (
+            BlogPost.objects
+            .only('id', 'title', 'comment_count', 'created_at', 'updated_at')
+            .order_by('-created_at', 'id')
+        )
     
     def get_serializer_class(self):
         if self.request.method == 'POST':
             return BlogPostCreateUpdateSerializer
         return BlogPostListSerializer
     
+    def list(self, request, *args, **kwargs):
+        # Any change to a post or its comments bumps its updated_at, so the
+        # latest updated_at plus the number of posts identifies the listing.
+        # Both are answered from the updated_at index without reading posts
+        stats = BlogPost.objects.aggregate(
+            last_modified=Max('updated_at'),
+            count=Count('*')
+        )
+        etag = _make_etag(stats['last_modified'], stats['count'])
+        
+        # No Last-Modified: deleting the latest post moves MAX(updated_at)
+        # backwards, so only the ETag (which includes the count) is reliable
+        response = _not_modified_response(request, etag, None)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+        return _set_validators(response, etag, None)
+    
+    @transaction.atomic
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -41,6 +102,9 @@ class BlogPostListCreateView(generics.ListCreateAPIView):
         # Save the new blog post
         blog_post = serializer.save()
         
+        # A new post has no comments, so skip querying for them
+        blog_post.recent_comments = []
+        
         # Return detailed representation of the created post
         detail_serializer = BlogPostDetailSerializer(blog_post)
         return Response(
@@ -51,7 +115,7 @@ class BlogPostListCreateView(generics.ListCreateAPIView):
 
 @extend_schema(
     tags=['Blog Posts'],
-    description='Retrieve a specific blog post with all comments',
+    description='Retrieve a specific blog post with its most recent comments',
     responses={
         200: BlogPostDetailSerializer,
         404: OpenApiResponse(description='Blog post not found'),
@@ -59,53 +123,118 @@ class BlogPostListCreateView(generics.ListCreateAPIView):
 )
 class BlogPostDetailView(generics.RetrieveAPIView):
     """
-    GET /api/posts/{id}: Retrieve a specific blog post with all comments.
+    GET /api/posts/{id}: Retrieve a specific blog post with its most recent comments.
     """
     lookup_field = 'id'
     serializer_class = BlogPostDetailSerializer
     
     def get_queryset(self):
-        return BlogPost.objects.prefetch_related('comments')
+        # Only the columns rendered by CommentSerializer (plus the key used to
+        # match comments to the post) are fetched. Any relation added to
+        # Comment later should be select_related() here to avoid an N+1
+        comments = (
+            Comment.objects
+            .only('id', 'author_name', 'content', 'created_at', 'blog_post')
+            .order_by('-created_at', '-id')
+        )
+        return BlogPost.objects.prefetch_related(
+            Prefetch(
+                'comments',
+                queryset=comments[:COMMENTS_PREVIEW_LIMIT],
+                to_attr='recent_comments'
+            )
+        )
     
     def retrieve(self, request, *args, **kwargs):
-        try:
-            instance = self.get_object()
-            serializer = self.get_serializer(instance)
-            return Response(serializer.data)
-        except BlogPost.DoesNotExist:
+        post_id = self.kwargs[self.lookup_field]
+        
+        # Fetch only what identifies the current version of the post; any
+        # edit or comment change bumps updated_at or comment_count
+        version = (
+            BlogPost.objects
+            .filter(id=post_id)
+            .values('updated_at', 'comment_count')
+            .first()
+        )
+        if version is None:
             return Response(
                 {'error': 'Blog post not found'}, 
                 status=status.HTTP_404_NOT_FOUND
             )
+        
+        last_modified = version['updated_at']
+        etag = _make_etag(last_modified, version['comment_count'])
+        
+        response = _not_modified_response(request, etag, last_modified)
+        if response is None:
+            cache_key = (
+                f"post:{post_id}:{last_modified.timestamp()}:{version['comment_count']}"
+            )
+            data = cache.get_or_set(
+                cache_key,
+                lambda: self.get_serializer(self.get_object()).data,
+                POST_DETAIL_CACHE_TIMEOUT
+            )
+            response = Response(data)
+        return _set_validators(response, etag, last_modified)
 
 
-@extend_schema(
-    tags=['Comments'],
-    description='Add a new comment to a specific blog post',
-    responses={
-        201: CommentSerializer,
-        404: OpenApiResponse(description='Blog post not found'),
-    }
+@extend_schema_view(
+    get=extend_schema(
+        tags=['Comments'],
+        description='List all comments of a specific blog post',
+        responses={
+            200: CommentSerializer(many=True),
+            404: OpenApiResponse(description='Blog post not found'),
+        }
+    ),
+    post=extend_schema(
+        tags=['Comments'],
+        description='Add a new comment to a specific blog post',
+        responses={
+            201: CommentSerializer,
+            404: OpenApiResponse(description='Blog post not found'),
+        }
+    ),
 )
-class CommentCreateView(generics.CreateAPIView):
+class CommentListCreateView(generics.ListCreateAPIView):
     """
+    GET /api/posts/{id}/comments: List all comments of a specific blog post.
     POST /api/posts/{id}/comments: Add a new comment to a specific blog post.
     """
     serializer_class = CommentSerializer
     lookup_url_kwarg = 'post_id'
     
+    def get_queryset(self):
+        return Comment.objects.filter(
+            blog_post_id=self.kwargs.get('post_id')
+        ).order_by('-created_at', '-id')
+    
+    def list(self, request, *args, **kwargs):
+        # Ensure the blog post exists
+        if not BlogPost.objects.filter(id=self.kwargs.get('post_id')).exists():
+            raise Http404
+        return super().list(request, *args, **kwargs)
+    
     def create(self, request, *args, **kwargs):
         post_id = self.kwargs.get('post_id')
         
-        # Ensure the blog post exists
-        blog_post = get_object_or_404(BlogPost, id=post_id)
-        
         # Validate comment data
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        # Save comment with the blog post relationship
-        comment = serializer.save(blog_post=blog_post)
+        # Save comment with the blog post relationship. The foreign key
+        # constraint guarantees the blog post exists; it is checked when
+        # the transaction commits, so the insert and the post update made by
+        # the comment signals run in their own transaction, committed here
+        try:
+            with transaction.atomic():
+                serializer.save(blog_post_id=post_id)
+        except IntegrityError:
+            # Only a missing blog post is a 404; re-raise any other violation
+            if not BlogPost.objects.filter(id=post_id).exists():
+                raise Http404
+            raise
         
         return Response(
             serializer.data, 
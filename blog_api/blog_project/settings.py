@@ -76,9 +76,37 @@ if DATABASE_URL.startswith('sqlite'):
         }
     }
 else:
+    # Keep connections open between requests and check them before reuse
     DATABASES = {
-        'default': dj_database_url.parse(DATABASE_URL)
+        'default': dj_database_url.parse(
+            DATABASE_URL,
+            conn_max_age=config('CONN_MAX_AGE', default=60, cast=int),
+            conn_health_checks=True,
+        )
     }
+    
+    if DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+        # Abort runaway queries instead of letting them hold a worker. Merge
+        # with any OPTIONS from the URL (e.g. sslmode) instead of replacing them
+        db_options = DATABASES['default'].setdefault('OPTIONS', {})
+        statement_timeout = '-c statement_timeout=%d' % config(
+            'DB_STATEMENT_TIMEOUT', default=3000, cast=int
+        )
+        db_options['options'] = ' '.join(
+            filter(None, [db_options.get('options'), statement_timeout])
+        )
+
+# Views open their own transactions where needed (see CommentListCreateView)
+DATABASES['default']['ATOMIC_REQUESTS'] = False
+
+# Cache (rendered blog post details are cached under versioned keys, so a
+# per-process cache never serves stale data)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'blog-api',
+    }
+}
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -113,10 +141,10 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Django REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'blog_app.renderers.ORJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'blog_app.parsers.ORJSONParser',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,